@@ -6,11 +6,7 @@ BASE_URL = "https://www.amazon.jobs/en/search.json"
 SLEEP = 0.25
 USER_AGENT = "Mozilla/5.0"
 
-# --- Houston center point (Downtown Houston) ---
-HOUSTON_LAT = 29.7604
-HOUSTON_LON = -95.3698
-
-def build_url(base_query="data engineer", offset=0, result_limit=50, radius="80km"):
+def build_url(base_query="data engineer", offset=0, result_limit=50):
     """
     Build a clean search.json URL.
     You can add/remove filters here anytime.
@@ -84,7 +80,7 @@ limit = 50
 # Pull until no more jobs
 while True:
     # Removed explicit "Houston" from base_query to get nationwide
-    url = build_url(base_query="data engineer", offset=offset, result_limit=limit, radius="80km")
+    url = build_url(base_query="data engineer", offset=offset, result_limit=limit)
     data = fetch_json(url)
     jobs = extract_jobs(data)
 
@@ -0,0 +1,289 @@
+import csv
+import math
+import os
+import re
+from functools import lru_cache
+
+# Bundled offline gazetteer (city,state,lat,lon) - no geocoding API calls needed
+GAZETTEER_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "us_cities.csv")
+# State bounding boxes (state,min_lat,max_lat,min_lon,max_lon) for state-only locations
+STATE_BOUNDS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "data", "us_states.csv")
+
+EARTH_RADIUS_KM = 6371.0
+KM_PER_DEG_LAT = EARTH_RADIUS_KM * math.pi / 180
+
+# Grid cell size for GridIndex, in degrees (~55km of latitude)
+DEFAULT_CELL_DEG = 0.5
+
+US_STATES = {
+    "AL": "Alabama", "AK": "Alaska", "AZ": "Arizona", "AR": "Arkansas", "CA": "California",
+    "CO": "Colorado", "CT": "Connecticut", "DE": "Delaware", "DC": "District of Columbia",
+    "FL": "Florida", "GA": "Georgia", "HI": "Hawaii", "ID": "Idaho", "IL": "Illinois",
+    "IN": "Indiana", "IA": "Iowa", "KS": "Kansas", "KY": "Kentucky", "LA": "Louisiana",
+    "ME": "Maine", "MD": "Maryland", "MA": "Massachusetts", "MI": "Michigan", "MN": "Minnesota",
+    "MS": "Mississippi", "MO": "Missouri", "MT": "Montana", "NE": "Nebraska", "NV": "Nevada",
+    "NH": "New Hampshire", "NJ": "New Jersey", "NM": "New Mexico", "NY": "New York",
+    "NC": "North Carolina", "ND": "North Dakota", "OH": "Ohio", "OK": "Oklahoma", "OR": "Oregon",
+    "PA": "Pennsylvania", "PR": "Puerto Rico", "RI": "Rhode Island", "SC": "South Carolina",
+    "SD": "South Dakota", "TN": "Tennessee", "TX": "Texas", "UT": "Utah", "VT": "Vermont",
+    "VA": "Virginia", "WA": "Washington", "WV": "West Virginia", "WI": "Wisconsin", "WY": "Wyoming",
+}
+STATE_BY_NAME = {name.lower(): abbr for abbr, name in US_STATES.items()}
+
+US_NAMES = {"us", "usa", "u.s.", "u.s.a.", "united states", "united states of america"}
+# Explicit non-US countries seen in (or likely in) the scraped postings
+FOREIGN_COUNTRIES = {
+    "united kingdom": "United Kingdom", "uk": "United Kingdom", "england": "United Kingdom",
+    "scotland": "United Kingdom", "ireland": "Ireland", "canada": "Canada", "mexico": "Mexico",
+    "brazil": "Brazil", "india": "India", "china": "China", "japan": "Japan",
+    "singapore": "Singapore", "australia": "Australia", "germany": "Germany", "france": "France",
+    "spain": "Spain", "italy": "Italy", "netherlands": "Netherlands", "poland": "Poland",
+    "israel": "Israel", "philippines": "Philippines", "costa rica": "Costa Rica",
+}
+
+REMOTE_PATTERN = re.compile(
+    r"\b(remote|work\s*(at|from)\s*home|wfh|telecommute|telework|virtual\s*(office|position|role))\b",
+    re.I
+)
+HYBRID_PATTERN = re.compile(r"\bhybrid\b", re.I)
+
+# Split "US, TX, Austin" / "TX - Irving" into parts.
+# Tight hyphens ("Work At Home-Florida", "Winston-Salem") are handled in _tokenize
+TOKEN_SPLIT = re.compile(r"\s*[,;/|]\s*|\s+-\s+")
+# Trailing state code without a comma: "Austin TX", "Austin TX 78701"
+TRAILING_STATE = re.compile(r"^(.+?)\s+([A-Za-z]{2})(?:\s+\d{5}(?:-\d{4})?)?$")
+
+_gazetteer = None
+_state_bounds = None
+
+
+def load_gazetteer(filename=GAZETTEER_FILE):
+    """
+    Loads the bundled city gazetteer once.
+    Returns {(city_lower, state_abbr): (lat, lon)} and {city_lower: [state_abbr, ...]}.
+    """
+    global _gazetteer
+    if _gazetteer is not None:
+        return _gazetteer
+
+    by_city_state = {}
+    states_by_city = {}
+    with open(filename, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            city = row["city"].strip().lower()
+            state = row["state"].strip().upper()
+            by_city_state[(city, state)] = (float(row["lat"]), float(row["lon"]))
+            states_by_city.setdefault(city, []).append(state)
+
+    _gazetteer = (by_city_state, states_by_city)
+    return _gazetteer
+
+
+def load_state_bounds(filename=STATE_BOUNDS_FILE):
+    """
+    Loads the bundled state bounding boxes once.
+    Returns {state_abbr: (min_lat, max_lat, min_lon, max_lon)}.
+    """
+    global _state_bounds
+    if _state_bounds is not None:
+        return _state_bounds
+
+    bounds = {}
+    with open(filename, "r", newline="") as f:
+        for row in csv.DictReader(f):
+            bounds[row["state"].strip().upper()] = tuple(
+                float(row[k]) for k in ("min_lat", "max_lat", "min_lon", "max_lon")
+            )
+
+    _state_bounds = bounds
+    return _state_bounds
+
+
+def state_within(state, lat, lon, radius_km):
+    """
+    True if any part of the state's bounding box is within radius_km of (lat, lon).
+    Unknown states return True (can't rule them out).
+    """
+    box = load_state_bounds().get(state)
+    if not box:
+        return True
+    min_lat, max_lat, min_lon, max_lon = box
+    # Nearest point of the box to the center
+    near_lat = min(max(lat, min_lat), max_lat)
+    near_lon = min(max(lon, min_lon), max_lon)
+    return haversine_km(lat, lon, near_lat, near_lon) <= radius_km
+
+
+def parse_country(tokens):
+    """
+    Returns "US" if the tokens name the US, the country name for an explicit
+    non-US country ("GLASGOW, LANARKSHIRE, United Kingdom"), else None.
+    """
+    for t in tokens:
+        key = t.strip().lower()
+        if key in US_NAMES:
+            return "US"
+        if key in FOREIGN_COUNTRIES:
+            return FOREIGN_COUNTRIES[key]
+    return None
+
+
+def parse_state(token):
+    """
+    Returns the 2-letter state code for "TX", "Texas", "TX 77002", else None.
+    """
+    t = re.sub(r"[\d.]+", "", token or "").strip()
+    if len(t) == 2 and t.upper() in US_STATES:
+        return t.upper()
+    return STATE_BY_NAME.get(t.lower())
+
+
+def work_mode(text):
+    """
+    Tags a location string as "hybrid", "remote" or "onsite".
+    """
+    t = text or ""
+    if HYBRID_PATTERN.search(t):
+        return "hybrid"
+    if REMOTE_PATTERN.search(t):
+        return "remote"
+    return "onsite"
+
+
+def _tokenize(text):
+    """
+    Splits a location string into candidate city/state tokens.
+    Hyphenated parts are kept whole first so "Winston-Salem" can still match,
+    then split so "Work At Home-Florida" yields "Florida".
+    """
+    tokens = []
+    for t in TOKEN_SPLIT.split(text or ""):
+        t = t.strip()
+        if not t:
+            continue
+        tokens.append(t)
+        if "-" in t:
+            tokens += [p.strip() for p in t.split("-") if p.strip()]
+        m = TRAILING_STATE.match(t)
+        if m and m.group(2).upper() in US_STATES:
+            tokens += [m.group(1).strip(), m.group(2)]
+    return tokens
+
+
+@lru_cache(maxsize=None)
+def _resolve(text, city, state):
+    # Memoized on the raw strings: scrapers repeat the same few locations a lot
+    by_city_state, _ = load_gazetteer()
+
+    tokens = _tokenize(text)
+    country = parse_country(tokens)
+    if country not in (None, "US"):
+        return (None, None, None, None, country)
+    if city:
+        tokens.insert(0, city.strip())
+    state_codes = [parse_state(state)] if state and parse_state(state) else []
+    state_codes += [s for s in (parse_state(t) for t in tokens) if s and s not in state_codes]
+
+    for t in tokens:
+        key = re.sub(r"\s+", " ", t.lower())
+        for s in state_codes:
+            if (key, s) in by_city_state:
+                return (t.title() if t.isupper() else t, s) + by_city_state[(key, s)] + ("US",)
+        # A bare city name is never trusted: the gazetteer is not a full list of
+        # US places, so "Columbus" alone could be any of several cities
+
+    if state_codes:
+        return (None, state_codes[0], None, None, "US")
+    return (None, None, None, None, country)
+
+
+def normalize_location(text, city=None, state=None):
+    """
+    Resolves a free-text location against the offline gazetteer.
+    Optional city/state hints (e.g. Amazon's city/state fields) take priority.
+    A city is only matched together with its state ("Columbus" alone stays unresolved).
+
+    Returns a dict with location_city, location_state, location_country, lat, lon
+    and work_mode. lat/lon are only set when a city was matched; state-only matches
+    ("GA, United States") get location_state but no coordinates. location_country is
+    "US", a non-US country name, or None when the string names no place at all.
+    """
+    # pandas hands missing fields over as NaN, so only trust real strings
+    text, city, state = [v if isinstance(v, str) else "" for v in (text, city, state)]
+    c, s, lat, lon, country = _resolve(text, city, state)
+    return {
+        "location_city": c,
+        "location_state": s,
+        "location_country": country,
+        "lat": lat,
+        "lon": lon,
+        "work_mode": work_mode(text),
+    }
+
+
+def haversine_km(lat1, lon1, lat2, lon2):
+    """
+    Great-circle distance between two points in km.
+    """
+    p1, p2 = math.radians(lat1), math.radians(lat2)
+    dp = p2 - p1
+    dl = math.radians(lon2 - lon1)
+    a = math.sin(dp / 2) ** 2 + math.cos(p1) * math.cos(p2) * math.sin(dl / 2) ** 2
+    return 2 * EARTH_RADIUS_KM * math.asin(math.sqrt(min(1.0, a)))
+
+
+class GridIndex:
+    """
+    Buckets points into fixed lat/lon cells so "within N km of X" only
+    touches the cells overlapping the search circle.
+    Cells entirely inside the circle are accepted without any distance math;
+    only boundary cells check each point.
+    """
+
+    def __init__(self, cell_deg=DEFAULT_CELL_DEG):
+        self.cell_deg = cell_deg
+        self.cells = {}
+
+    def _cell(self, lat, lon):
+        return (math.floor(lat / self.cell_deg), math.floor(lon / self.cell_deg))
+
+    def add(self, lat, lon, item):
+        self.cells.setdefault(self._cell(lat, lon), []).append((lat, lon, item))
+
+    def within(self, lat, lon, radius_km):
+        """
+        Returns the items within radius_km of (lat, lon).
+        """
+        d_lat = radius_km / KM_PER_DEG_LAT
+        # Widest longitude span of the circle on the sphere (180 if it covers a pole)
+        sin_r = math.sin(min(math.pi, radius_km / EARTH_RADIUS_KM))
+        cos_lat = math.cos(math.radians(lat))
+        if sin_r >= cos_lat or radius_km / EARTH_RADIUS_KM >= math.pi / 2:
+            d_lon = 180.0
+        else:
+            d_lon = math.degrees(math.asin(sin_r / cos_lat))
+        # Pad by a hair so float rounding never drops a cell on the boundary
+        d_lat += 1e-9
+        d_lon += 1e-9
+
+        lat0, lon0 = self._cell(lat - d_lat, lon - d_lon)
+        lat1, lon1 = self._cell(lat + d_lat, lon + d_lon)
+
+        results = []
+        for ci in range(lat0, lat1 + 1):
+            for cj in range(lon0, lon1 + 1):
+                bucket = self.cells.get((ci, cj))
+                if not bucket:
+                    continue
+
+                south, west = ci * self.cell_deg, cj * self.cell_deg
+                north, east = south + self.cell_deg, west + self.cell_deg
+                corners = ((south, west), (south, east), (north, west), (north, east))
+                if all(haversine_km(lat, lon, a, b) <= radius_km for a, b in corners):
+                    results.extend(item for _, _, item in bucket)
+                    continue
+
+                for plat, plon, item in bucket:
+                    if haversine_km(lat, lon, plat, plon) <= radius_km:
+                        results.append(item)
+        return results
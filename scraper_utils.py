@@ -5,6 +5,17 @@ import dateutil.parser
 
 import re
 
+from location_utils import normalize_location, state_within, GridIndex
+
+# --- Location filter (shared by all scrapers) ---
+# Houston center point (Downtown Houston)
+HOUSTON_LAT = 29.7604
+HOUSTON_LON = -95.3698
+SEARCH_CENTER = (HOUSTON_LAT, HOUSTON_LON)
+# Set to e.g. 80 to keep only jobs within 80km of SEARCH_CENTER (remote jobs are always kept).
+# None keeps the nationwide results.
+SEARCH_RADIUS_KM = None
+
 # Regex Filters
 INCLUDE_TITLE = re.compile(
     r"\b(data\s*engineer|data\s*engineering|analytics\s*engineer|etl|data\s*platform|data\s*pipeline|data\s*warehouse|big\s*data)\b",
@@ -59,10 +70,62 @@ def has_too_much_experience(description: str) -> bool:
             
     return False
 
-def save_jobs(new_jobs, filename="ui/jobs.json"):
+def add_location_fields(job):
+    """
+    Adds normalized location fields (location_city, location_state, location_country, lat, lon, work_mode)
+    to a job dict in place. Uses Amazon's city/state fields as hints when present.
+    """
+    job.update(normalize_location(job.get("location"), city=job.get("city"), state=job.get("state")))
+    return job
+
+def jobs_within_radius(jobs, center, radius_km):
+    """
+    Returns the positions of the jobs in the list within radius_km of center=(lat, lon).
+    Jobs must already have lat/lon from add_location_fields; jobs without coordinates are never matched.
+    """
+    index = GridIndex()
+    for i, job in enumerate(jobs):
+        if job.get("lat") is not None and job.get("lon") is not None:
+            index.add(job["lat"], job["lon"], i)
+    return set(index.within(center[0], center[1], radius_km))
+
+def filter_by_radius(jobs, center, radius_km):
+    """
+    Drops jobs located more than radius_km from center=(lat, lon).
+    Jobs must already have location fields from add_location_fields.
+    Returns (kept_jobs, unplaced) where unplaced counts the kept jobs whose location
+    couldn't be placed at all ("48 Locations").
+    """
+    nearby = jobs_within_radius(jobs, center, radius_km)
+    kept = []
+    unplaced = 0
+    for i, job in enumerate(jobs):
+        # Remote jobs can be worked from anywhere
+        if job.get("work_mode") != "remote":
+            if job.get("lat") is not None:
+                if i not in nearby:
+                    continue
+            elif job.get("location_country") not in (None, "US"):
+                continue
+            elif job.get("location_state"):
+                if not state_within(job["location_state"], center[0], center[1], radius_km):
+                    continue
+            else:
+                unplaced += 1
+        kept.append(job)
+    return kept, unplaced
+
+def save_jobs(new_jobs, filename="ui/jobs.json", center=SEARCH_CENTER, radius_km=SEARCH_RADIUS_KM):
     """
     Saves a list of job dictionaries to the specified JSON file.
     If the file exists, it merges the new jobs with existing ones (deduplicating by ID if possible).
+    Jobs (new and already saved) located more than radius_km from center=(lat, lon) are dropped
+    (defaults to SEARCH_CENTER / SEARCH_RADIUS_KM; None disables the filter):
+    - remote jobs are always kept
+    - city matches are checked by distance
+    - state-only matches ("GA, United States") are dropped if the whole state is out of range
+    - explicit non-US countries ("..., United Kingdom") are dropped
+    - strings we can't place at all ("48 Locations") are kept and counted in the log
     """
     os.makedirs(os.path.dirname(filename), exist_ok=True)
     
@@ -88,6 +151,9 @@ def save_jobs(new_jobs, filename="ui/jobs.json"):
     # The user request implies they want this logic applied.
     # Apply filtering to NEW jobs only (or all? Safer to filter new ones first)
     # The user request implies they want this logic applied.
+    for j in new_jobs:
+        add_location_fields(j)
+
     filtered_new_jobs = []
     for j in new_jobs:
         title = j.get('title', '')
@@ -106,6 +172,12 @@ def save_jobs(new_jobs, filename="ui/jobs.json"):
              
         filtered_new_jobs.append(j)
 
+    # Check distance
+    if center and radius_km:
+        filtered_new_jobs, unplaced = filter_by_radius(filtered_new_jobs, center, radius_km)
+        if unplaced:
+            print(f"Radius filter: keeping {unplaced} jobs with no recognizable location (can't check distance).")
+
     print(f"Filtered {len(new_jobs)} raw jobs down to {len(filtered_new_jobs)} relevant Data Engineer roles (<6 YOE, <7 Days).")
 
     all_candidates = existing_jobs + filtered_new_jobs
@@ -131,8 +203,14 @@ def save_jobs(new_jobs, filename="ui/jobs.json"):
     final_list = []
     for job in job_map.values():
         if is_recent(job.get("posted_date"), days=7):
+            # Re-normalize older entries too (cached), they may predate the current resolver
+            add_location_fields(job)
             final_list.append(job)
 
+    # Existing jobs are radius-filtered too, so changing SEARCH_CENTER / SEARCH_RADIUS_KM applies right away
+    if center and radius_km:
+        final_list, _ = filter_by_radius(final_list, center, radius_km)
+
     
     # Write back to JSON for persistence between script runs
     with open(filename, "w") as f:
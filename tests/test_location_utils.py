@@ -0,0 +1,71 @@
+import math
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from location_utils import GridIndex, haversine_km, normalize_location, state_within
+
+
+def test_grid_matches_brute_force():
+    rng = random.Random(0)
+    points = [(rng.uniform(24, 49), rng.uniform(-125, -66)) for _ in range(3000)]
+
+    index = GridIndex()
+    for i, (lat, lon) in enumerate(points):
+        index.add(lat, lon, i)
+
+    for _ in range(50):
+        clat, clon = rng.uniform(25, 48), rng.uniform(-124, -67)
+        radius = rng.choice([10, 80, 250, 600])
+        expected = {i for i, (lat, lon) in enumerate(points) if haversine_km(clat, clon, lat, lon) <= radius}
+        assert set(index.within(clat, clon, radius)) == expected
+
+
+def test_grid_keeps_points_on_cell_boundary():
+    # Circle's north edge lands just past the 30.0 cell boundary; the point
+    # sits just inside the radius, in the cell above the center's band
+    r = 80
+    km_per_deg = 6371.0 * math.pi / 180
+    clat, clon = 30 - (r / 111.32 + r / km_per_deg) / 2, -95.0
+    lat = clat + r / km_per_deg - 1e-5
+    assert lat > 30 and haversine_km(clat, clon, lat, clon) <= r
+
+    index = GridIndex()
+    index.add(lat, clon, "edge")
+    assert index.within(clat, clon, r) == ["edge"]
+
+
+def test_resolves_scraped_locations():
+    irving = normalize_location("TX - Irving")
+    assert (irving["location_city"], irving["location_state"]) == ("Irving", "TX")
+    assert irving["lat"] is not None
+
+    austin = normalize_location("US, TX, Austin")
+    assert (austin["location_city"], austin["location_state"]) == ("Austin", "TX")
+
+    florida = normalize_location("Work At Home-Florida")
+    assert florida["location_state"] == "FL"
+    assert florida["lat"] is None
+    assert florida["work_mode"] == "remote"
+
+    multi = normalize_location("48 Locations")
+    assert multi["location_state"] is None and multi["lat"] is None
+
+    georgia = normalize_location("GA, United States")
+    assert georgia["location_state"] == "GA" and georgia["lat"] is None
+
+    glasgow = normalize_location("GLASGOW, LANARKSHIRE, United Kingdom")
+    assert glasgow["location_country"] == "United Kingdom" and glasgow["location_state"] is None
+
+    # City names are not trusted without a state
+    assert normalize_location("Portland")["lat"] is None
+    assert normalize_location("Columbus")["lat"] is None
+
+
+def test_state_within():
+    houston = (29.7604, -95.3698)
+    assert state_within("TX", *houston, 80)
+    assert not state_within("GA", *houston, 80)
+    assert state_within("LA", *houston, 200)